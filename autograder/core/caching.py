@@ -1,3 +1,6 @@
+from decimal import Decimal
+from typing import Dict, Sequence, Union
+
 from django.core.cache import cache
 
 import autograder.core.models as ag_models
@@ -11,9 +14,16 @@ def clear_submission_results_cache(project_pk: int) -> None:
 
 
 def delete_cached_submission_result(submission: ag_models.Submission) -> None:
-    cache_key = submission_fdbk_cache_key(
-        project_pk=submission.group.project.pk, submission_pk=submission.pk)
-    cache.delete(cache_key)
+    project_pk = submission.group.project.pk
+    cache_keys = [
+        submission_fdbk_cache_key(project_pk=project_pk, submission_pk=submission.pk)
+    ]
+    cache_keys += [
+        submission_total_points_cache_key(
+            project_pk=project_pk, submission_pk=submission.pk, fdbk_category=fdbk_category)
+        for fdbk_category in ag_models.FeedbackCategory
+    ]
+    cache.delete_many(cache_keys)
 
 
 def get_cached_submission_feedback(submission: ag_models.Submission,
@@ -36,5 +46,56 @@ def get_cached_submission_feedback(submission: ag_models.Submission,
     return result
 
 
+def get_cached_submission_total_points(
+    project_pk: int,
+    submission_pks: Sequence[int],
+    fdbk_category: ag_models.FeedbackCategory
+) -> Dict[int, Decimal]:
+    """
+    Loads cached total point values for the given submissions with one
+    cache round trip. Returns a dict mapping submission pk to total
+    points for the submissions that had a cached value; the other
+    requested pks are absent from the result.
+    """
+    cache_keys = {
+        submission_total_points_cache_key(
+            project_pk=project_pk, submission_pk=submission_pk, fdbk_category=fdbk_category
+        ): submission_pk
+        for submission_pk in submission_pks
+    }
+    return {
+        cache_keys[key]: Decimal(value)
+        for key, value in cache.get_many(cache_keys).items()
+    }
+
+
+def set_cached_submission_total_points(
+    project_pk: int,
+    total_points: Dict[int, Union[int, Decimal]],
+    fdbk_category: ag_models.FeedbackCategory
+) -> None:
+    """
+    Caches total point values, given as a dict mapping submission pk to
+    total points. Values are stored as strings so that Decimals survive
+    the JSON cache serializer.
+    """
+    cache.set_many({
+        submission_total_points_cache_key(
+            project_pk=project_pk, submission_pk=submission_pk, fdbk_category=fdbk_category
+        ): str(points)
+        for submission_pk, points in total_points.items()
+    }, timeout=None)
+
+
 def submission_fdbk_cache_key(*, project_pk: int, submission_pk: int) -> str:
     return f'project_{project_pk}_submission_normal_results_{submission_pk}'
+
+
+def submission_total_points_cache_key(
+    *, project_pk: int, submission_pk: int, fdbk_category: ag_models.FeedbackCategory
+) -> str:
+    # Note: this deliberately extends submission_fdbk_cache_key's naming
+    # scheme so that clear_submission_results_cache's pattern delete
+    # wipes these entries as well.
+    return (f'project_{project_pk}_submission_normal_results_{submission_pk}'
+            f'_total_points_{fdbk_category.value}')
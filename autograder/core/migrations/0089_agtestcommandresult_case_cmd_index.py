@@ -0,0 +1,17 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0088_auto_20200924_1311'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='agtestcommandresult',
+            index=models.Index(fields=['ag_test_case_result', 'ag_test_command'], name='agtcr_case_cmd_idx'),
+        ),
+    ]
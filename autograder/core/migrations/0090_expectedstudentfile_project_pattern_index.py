@@ -0,0 +1,17 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0089_agtestcommandresult_case_cmd_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expectedstudentfile',
+            index=models.Index(fields=['project', 'pattern'], name='expected_file_proj_pattern_idx'),
+        ),
+    ]
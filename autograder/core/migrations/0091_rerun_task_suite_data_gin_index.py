@@ -0,0 +1,26 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('core', '0090_expectedstudentfile_project_pattern_index'),
+    ]
+
+    operations = [
+        # jsonb_path_ops only supports the containment operators, but
+        # produces a much smaller and faster index than the default
+        # jsonb_ops for "@>" lookups against ag_test_suite_data.
+        migrations.RunSQL(
+            sql="""CREATE INDEX CONCURRENTLY IF NOT EXISTS
+                       rerunsubmissionstask_ag_test_suite_data_gin
+                       ON core_rerunsubmissionstask
+                       USING GIN (ag_test_suite_data jsonb_path_ops)""",
+            reverse_sql="""DROP INDEX CONCURRENTLY IF EXISTS
+                               rerunsubmissionstask_ag_test_suite_data_gin""",
+        ),
+    ]
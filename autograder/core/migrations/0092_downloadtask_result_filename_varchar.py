@@ -0,0 +1,18 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0091_rerun_task_suite_data_gin_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='downloadtask',
+            name='result_filename',
+            field=models.CharField(blank=True, max_length=510),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0092_downloadtask_result_filename_varchar'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='agtestcommandresult',
+            name='return_code_correct',
+            field=models.BooleanField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='agtestcommandresult',
+            name='stderr_correct',
+            field=models.BooleanField(blank=True, default=None, null=True),
+        ),
+        migrations.AlterField(
+            model_name='agtestcommandresult',
+            name='stdout_correct',
+            field=models.BooleanField(blank=True, default=None, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0093_agtestcommandresult_nullable_booleanfield'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['group', 'timestamp', 'status'], name='submission_group_limit_idx'),
+        ),
+    ]
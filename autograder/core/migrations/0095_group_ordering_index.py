@@ -0,0 +1,17 @@
+# Generated by Django 3.1.1
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0094_submission_group_limit_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='group',
+            index=models.Index(fields=['project', '_member_names'], name='group_project_members_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.1.1
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0095_group_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='group',
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=['_member_names'], name='group_member_names_gin'),
+        ),
+    ]
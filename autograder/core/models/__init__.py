@@ -1,4 +1,9 @@
 # Import all Model classes here.
+#
+# These imports must stay eager: Django registers each model with the
+# app registry when its module is imported, and it imports this package
+# during app loading to trigger that. Deferring them (e.g. with a
+# module-level __getattr__) would leave models unregistered.
 
 from .ag_command import AGCommandResult, AGCommandResultBase, Command
 from .ag_model_base import AutograderModel
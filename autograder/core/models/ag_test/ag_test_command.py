@@ -19,6 +19,11 @@ class ValueFeedbackLevel(core_ut.OrderedEnum):
     expected_and_actual = 'expected_and_actual'
 
 
+# get_max() walks the enum members on every call, so look it up once
+# here for the feedback config constructors below.
+_MAX_VALUE_FDBK_LEVEL = ValueFeedbackLevel.get_max()
+
+
 class AGTestCommandFeedbackConfig(DictSerializableMixin):
     """
     Contains feedback options for an AGTestCommand
@@ -67,9 +72,9 @@ class AGTestCommandFeedbackConfig(DictSerializableMixin):
     @classmethod
     def max_fdbk_config(cls):
         return AGTestCommandFeedbackConfig(
-            return_code_fdbk_level=ValueFeedbackLevel.get_max(),
-            stdout_fdbk_level=ValueFeedbackLevel.get_max(),
-            stderr_fdbk_level=ValueFeedbackLevel.get_max(),
+            return_code_fdbk_level=_MAX_VALUE_FDBK_LEVEL,
+            stdout_fdbk_level=_MAX_VALUE_FDBK_LEVEL,
+            stderr_fdbk_level=_MAX_VALUE_FDBK_LEVEL,
             show_points=True,
             show_actual_return_code=True,
             show_actual_stdout=True,
@@ -333,27 +338,43 @@ class AGTestCommand(AutograderModel):
         except exceptions.ValidationError as e:
             error_dict = e.error_dict
 
+        # Walk the relation chain once and compare foreign key ids so
+        # that each branch (and each instructor file) doesn't lazily
+        # load its own copy of the suite and project rows. The project
+        # object itself is only fetched on the error paths, for the
+        # messages. Don't touch the chain unless a branch needs it:
+        # ag_test_case may legitimately be unset at this point.
+        needs_project_check = (
+            (self.stdin_source == StdinSource.instructor_file
+             and self.stdin_instructor_file is not None)
+            or (self.expected_stdout_source == ExpectedOutputSource.instructor_file
+                and self.expected_stdout_instructor_file is not None)
+            or (self.expected_stderr_source == ExpectedOutputSource.instructor_file
+                and self.expected_stderr_instructor_file is not None)
+        )
+        ag_test_suite = self.ag_test_case.ag_test_suite if needs_project_check else None
+
         if self.stdin_source == StdinSource.instructor_file:
             if self.stdin_instructor_file is None:
                 error_dict['stdin_instructor_file'] = (
                     'This field may not be None when stdin source is instructor file.')
-            elif self.stdin_instructor_file.project != self.ag_test_case.ag_test_suite.project:
+            elif self.stdin_instructor_file.project_id != ag_test_suite.project_id:
                 error_dict['stdin_instructor_file'] = (
                     'Instructor file {} does not belong to project {}'.format(
                         self.stdin_instructor_file.name,
-                        self.ag_test_case.ag_test_suite.project)
+                        ag_test_suite.project)
                 )
 
         if self.expected_stdout_source == ExpectedOutputSource.instructor_file:
             if self.expected_stdout_instructor_file is None:
                 error_dict['expected_stdout_instructor_file'] = (
                     'This field may not be None when expected stdout source is instructor file.')
-            elif (self.expected_stdout_instructor_file.project
-                    != self.ag_test_case.ag_test_suite.project):
+            elif (self.expected_stdout_instructor_file.project_id
+                    != ag_test_suite.project_id):
                 error_dict['expected_stdout_instructor_file'] = (
                     'Instructor_file {} does not belong to project {}'.format(
                         self.expected_stdout_instructor_file.name,
-                        self.ag_test_case.ag_test_suite.project
+                        ag_test_suite.project
                     )
                 )
 
@@ -361,12 +382,12 @@ class AGTestCommand(AutograderModel):
             if self.expected_stderr_instructor_file is None:
                 error_dict['expected_stderr_instructor_file'] = (
                     'This field may not be None when expected stderr source is instructor file.')
-            elif (self.expected_stderr_instructor_file.project
-                    != self.ag_test_case.ag_test_suite.project):
+            elif (self.expected_stderr_instructor_file.project_id
+                    != ag_test_suite.project_id):
                 error_dict['expected_stderr_instructor_file'] = (
                     'Instructor_file {} does not belong to project {}'.format(
                         self.expected_stderr_instructor_file.name,
-                        self.ag_test_case.ag_test_suite.project
+                        ag_test_suite.project
                     )
                 )
 
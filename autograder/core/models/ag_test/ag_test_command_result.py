@@ -1,6 +1,7 @@
 import os
 
 from django.db import models
+from django.utils.functional import cached_property
 
 import autograder.core.utils as core_ut
 
@@ -17,6 +18,13 @@ class AGTestCommandResult(AGCommandResultBase):
     class Meta:
         unique_together = ('ag_test_command', 'ag_test_case_result')
         ordering = ('ag_test_command___order',)
+        indexes = [
+            # The unique_together index above leads with ag_test_command,
+            # so it can't serve the prefetch/join pattern used when
+            # loading results, which filters on ag_test_case_result.
+            models.Index(fields=['ag_test_case_result', 'ag_test_command'],
+                         name='agtcr_case_cmd_idx'),
+        ]
 
     ag_test_command = models.ForeignKey(
         AGTestCommand, on_delete=models.CASCADE,
@@ -29,21 +37,23 @@ class AGTestCommandResult(AGCommandResultBase):
                      A value of None indicates that this AGTestCommandResult
                      is the result of an AGTestSuite's setup command.''')
 
-    return_code_correct = models.NullBooleanField(null=True, default=None)
-    stdout_correct = models.NullBooleanField(null=True, default=None)
-    stderr_correct = models.NullBooleanField(null=True, default=None)
+    # None indicates that correctness isn't checked for that item.
+    return_code_correct = models.BooleanField(null=True, blank=True, default=None)
+    stdout_correct = models.BooleanField(null=True, blank=True, default=None)
+    stderr_correct = models.BooleanField(null=True, blank=True, default=None)
+
+    @cached_property
+    def _result_output_dir(self):
+        return core_ut.get_result_output_dir(
+            self.ag_test_case_result.ag_test_suite_result.submission)
 
     @property
     def stdout_filename(self):
-        result_output_dir = core_ut.get_result_output_dir(
-            self.ag_test_case_result.ag_test_suite_result.submission)
-        return os.path.join(result_output_dir, 'cmd_result_{}_stdout'.format(self.pk))
+        return os.path.join(self._result_output_dir, 'cmd_result_{}_stdout'.format(self.pk))
 
     @property
     def stderr_filename(self):
-        result_output_dir = core_ut.get_result_output_dir(
-            self.ag_test_case_result.ag_test_suite_result.submission)
-        return os.path.join(result_output_dir, 'cmd_result_{}_stderr'.format(self.pk))
+        return os.path.join(self._result_output_dir, 'cmd_result_{}_stderr'.format(self.pk))
 
     # Serializing AGTestCommandResults should be used for DENORMALIZATION
     # ONLY.
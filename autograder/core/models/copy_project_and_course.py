@@ -6,7 +6,7 @@ from django.db import transaction
 from autograder import utils
 from autograder.handgrading.import_handgrading_rubric import import_handgrading_rubric
 from .course import Course, Semester
-from .project import Project, InstructorFile
+from .project import Project, InstructorFile, ExpectedStudentFile
 from .ag_test.ag_test_suite import AGTestSuite
 from .ag_test.ag_test_case import AGTestCase
 from .ag_test.ag_test_command import AGTestCommand
@@ -44,10 +44,14 @@ def copy_project(project: Project, target_course: Course,
                 project=new_project,
                 file_obj=SimpleUploadedFile(instructor_file.name, f.read()))
 
+    # The copies were already validated when they were created on the
+    # source project, so insert them all in one query.
+    student_file_copies = []
     for student_file in project.expected_student_files.all():
         student_file.pk = None
         student_file.project = new_project
-        student_file.save()
+        student_file_copies.append(student_file)
+    ExpectedStudentFile.objects.bulk_create(student_file_copies)
 
     _copy_ag_tests(project, new_project)
     _copy_mutation_suites(project, new_project)
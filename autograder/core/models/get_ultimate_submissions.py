@@ -12,17 +12,40 @@ from .group import Group
 from .submission import Submission, get_submissions_with_results_queryset
 
 
-def get_ultimate_submission(group: Group, user: Optional[User]=None) -> Optional[Submission]:
+def get_ultimate_submission(
+    group: Group, user: Optional[User]=None,
+    *, ag_test_preloader: Optional[AGTestPreLoader]=None,
+    mutation_test_suite_preloader: Optional[MutationTestSuitePreLoader]=None
+) -> Optional[Submission]:
+    """
+    Callers that look up ultimate submissions for many groups of the
+    same project should pass in shared preloaders so that the project's
+    test case data is only fetched once.
+    """
     project = group.project
-    [group] = _prefetch_submissions(project, [group])
     if project.ultimate_submission_policy == UltimateSubmissionPolicy.most_recent:
-        return _get_most_recent_submission(group, user)
-    elif project.ultimate_submission_policy == UltimateSubmissionPolicy.best_with_normal_fdbk:
+        # For a single group we only need one row, so let the database
+        # apply LIMIT 1 instead of prefetching results for every
+        # finished submission the group has.
+        queryset = group.submissions.filter(
+            status=Submission.GradingStatus.finished_grading)
+        if user is not None:
+            queryset = queryset.exclude(does_not_count_for__contains=[user.username])
+
+        return queryset.first()
+
+    [group] = _prefetch_submissions(project, [group])
+    if ag_test_preloader is None:
+        ag_test_preloader = AGTestPreLoader(project)
+    if mutation_test_suite_preloader is None:
+        mutation_test_suite_preloader = MutationTestSuitePreLoader(project)
+
+    if project.ultimate_submission_policy == UltimateSubmissionPolicy.best_with_normal_fdbk:
         best = _get_best_submission(
             group,
             FeedbackCategory.normal,
-            ag_test_preloader=AGTestPreLoader(project),
-            mutation_test_suite_preloader=MutationTestSuitePreLoader(project),
+            ag_test_preloader=ag_test_preloader,
+            mutation_test_suite_preloader=mutation_test_suite_preloader,
             user=user
         )
         return best.submission if best is not None else None
@@ -30,8 +53,8 @@ def get_ultimate_submission(group: Group, user: Optional[User]=None) -> Optional
         best = _get_best_submission(
             group,
             FeedbackCategory.max,
-            ag_test_preloader=AGTestPreLoader(project),
-            mutation_test_suite_preloader=MutationTestSuitePreLoader(project),
+            ag_test_preloader=ag_test_preloader,
+            mutation_test_suite_preloader=mutation_test_suite_preloader,
             user=user
         )
         return best.submission if best is not None else None
@@ -56,14 +79,19 @@ def get_ultimate_submissions(
     mutation_test_suite_preloader = MutationTestSuitePreLoader(project)
 
     if project.ultimate_submission_policy == UltimateSubmissionPolicy.most_recent:
+        # Note: group.submissions.count() and group.submissions.first()
+        # would each issue a fresh query per group instead of using the
+        # prefetch cache that _prefetch_submissions populated.
+        most_recent_submissions = (
+            _get_most_recent_submission(group) for group in filter_groups)
         return (
             SubmissionResultFeedback(
-                group.submissions.first(),
+                submission,
                 FeedbackCategory.max,
                 ag_test_preloader,
                 mutation_test_suite_preloader
             )
-            for group in filter_groups if group.submissions.count()
+            for submission in most_recent_submissions if submission is not None
         )
     elif project.ultimate_submission_policy == UltimateSubmissionPolicy.best_with_normal_fdbk:
         warnings.warn('best_with_normal_fdbk is currently untested and may be deprecated soon.',
@@ -103,29 +131,70 @@ def _prefetch_submissions(project: Project, groups: Optional[Sequence[Group]]) -
 
     submissions_queryset = get_submissions_with_results_queryset(
         base_manager=finished_submissions_queryset)
-    return base_group_queryset.prefetch_related(Prefetch('submissions', submissions_queryset))
-
+    # select_related('project') prevents SubmissionResultFeedback's
+    # submission.group.project accesses from issuing one query per group.
+    return base_group_queryset.select_related('project').prefetch_related(
+        Prefetch('submissions', submissions_queryset))
 
-def _get_most_recent_submission(group: Group, user: Optional[User]=None) -> Optional[Submission]:
-    for submission in group.submissions.all():
-        if user is None or user.username not in submission.does_not_count_for:
-            return submission
 
-    return None
+def _get_most_recent_submission(group: Group) -> Optional[Submission]:
+    # Reads from the prefetch cache populated by _prefetch_submissions.
+    return next(iter(group.submissions.all()), None)
 
 
 def _get_best_submission(group: Group, fdbk_category: FeedbackCategory,
                          ag_test_preloader: AGTestPreLoader,
                          mutation_test_suite_preloader: MutationTestSuitePreLoader,
                          user: Optional[User]=None) -> Optional[SubmissionResultFeedback]:
-    best: Optional[SubmissionResultFeedback] = None
-    for submission in group.submissions.all():
-        if user is not None and user.username in submission.does_not_count_for:
-            continue
-
-        fdbk = SubmissionResultFeedback(
-            submission, fdbk_category, ag_test_preloader, mutation_test_suite_preloader)
-        if best is None or fdbk.total_points > best.total_points:
-            best = fdbk
-
-    return best
+    # Imported here to avoid a circular import at module load time.
+    from autograder.core.caching import (
+        get_cached_submission_total_points, set_cached_submission_total_points)
+
+    # group.submissions was prefetched by _prefetch_submissions, so
+    # this iterates the cache rather than querying per group.
+    submissions = [
+        submission for submission in group.submissions.all()
+        if user is None or user.username not in submission.does_not_count_for
+    ]
+    if not submissions:
+        return None
+
+    # Computing total_points walks every denormalized suite/case/command
+    # result for the submission, so cache the totals and only do that
+    # walk for submissions whose results changed since the last call.
+    # The cache is invalidated with the rest of the submission results
+    # cache (see autograder.core.caching).
+    #
+    # Note: totals can't be pushed down into a SQL aggregate. They
+    # depend on the feedback config visibility rules and on per-test
+    # clamping (e.g. AGTestCaseResultFeedback.total_points is floored
+    # at 0), which only the feedback classes implement.
+    cached_points = get_cached_submission_total_points(
+        group.project_id, [submission.pk for submission in submissions], fdbk_category)
+
+    best_submission: Optional[Submission] = None
+    best_fdbk: Optional[SubmissionResultFeedback] = None
+    best_points = None
+    points_to_cache = {}
+    for submission in submissions:
+        fdbk = None
+        points = cached_points.get(submission.pk)
+        if points is None:
+            fdbk = SubmissionResultFeedback(
+                submission, fdbk_category, ag_test_preloader, mutation_test_suite_preloader)
+            points = fdbk.total_points
+            points_to_cache[submission.pk] = points
+
+        if best_points is None or points > best_points:
+            best_points = points
+            best_submission = submission
+            best_fdbk = fdbk
+
+    if points_to_cache:
+        set_cached_submission_total_points(group.project_id, points_to_cache, fdbk_category)
+
+    if best_fdbk is None:
+        best_fdbk = SubmissionResultFeedback(
+            best_submission, fdbk_category, ag_test_preloader, mutation_test_suite_preloader)
+
+    return best_fdbk
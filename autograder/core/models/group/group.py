@@ -2,6 +2,7 @@ import os
 from typing import List
 
 import django.contrib.postgres.fields as pg_fields
+import django.contrib.postgres.indexes as pg_indexes
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
@@ -10,7 +11,6 @@ from django.db.models.expressions import F
 from django.utils import timezone
 
 import autograder.core.utils as core_ut
-from autograder import utils
 from autograder.core import constants
 
 from .. import ag_model_base
@@ -30,19 +30,53 @@ class GroupManager(ag_model_base.AutograderModelManager):
                 will NOT be run.
                 Default value: True
         """
+        # Note: don't be tempted to pass savepoint=False here to skip
+        # the savepoint when nested in a view's transaction.
+        # ValidationError is an expected exit from this method, and
+        # without the savepoint it would poison the enclosing
+        # transaction for callers that catch the error and continue.
         with transaction.atomic():
             verification.verify_users_can_be_in_group(
                 members, kwargs['project'], 'members',
                 check_group_size_limits=check_group_size_limits)
 
-            member_names = [
-                user.username for user in sorted(members, key=lambda user: user.username)]
+            member_names = sorted(user.username for user in members)
             group = self.model(_member_names=member_names, **kwargs)
+            # Validate before save() so that invalid input never
+            # creates the database row or the group's directory on
+            # disk. Adding members afterwards doesn't affect any model
+            # validators (membership is checked above), so there's no
+            # need for a second full_clean pass after the m2m add.
+            group.full_clean()
             group.save()
             group.members.add(*members)
-            group.full_clean()
             return group
 
+    def with_submission_counts(self, start_datetime, end_datetime):
+        """
+        Annotates each group with _num_submissions and
+        _num_submits_towards_limit (the latter restricted to the given
+        24-hour window). Both counts are computed by the database, so
+        batch consumers (the list groups endpoint, analytics) never
+        load the submission rows themselves.
+        """
+        towards_limit = models.Q(
+            submissions__timestamp__gte=start_datetime,
+            submissions__timestamp__lt=end_datetime,
+            submissions__status__in=Submission.GradingStatus.count_towards_limit_statuses)
+
+        return self.annotate(
+            _num_submissions=models.Count('submissions'),
+            _num_submits_towards_limit=models.Count('submissions', filter=towards_limit))
+
+    def containing_username(self, username: str):
+        """
+        Returns a queryset of the groups that have the given username
+        as a member. Uses the denormalized _member_names column (backed
+        by a GIN index) rather than joining through the members table.
+        """
+        return self.filter(_member_names__contains=[username])
+
 
 class Group(ag_model_base.AutograderModel):
     """
@@ -56,6 +90,16 @@ class Group(ag_model_base.AutograderModel):
 
     class Meta:
         ordering = ('_member_names',)
+        indexes = [
+            # Groups are almost always listed per project and ordered
+            # by member names; this lets that be an index scan instead
+            # of a sort.
+            models.Index(fields=['project', '_member_names'],
+                         name='group_project_members_idx'),
+            # Serves GroupManager.containing_username.
+            pg_indexes.GinIndex(fields=['_member_names'],
+                                name='group_member_names_gin'),
+        ]
 
     objects = GroupManager()
 
@@ -145,6 +189,12 @@ class Group(ag_model_base.AutograderModel):
 
     @property
     def num_submissions(self) -> int:
+        # List views annotate this count so that serializing many
+        # groups doesn't need the submission rows. count() below hits
+        # the prefetch cache when submissions were prefetched.
+        if hasattr(self, '_num_submissions'):
+            return self._num_submissions
+
         return self.submissions.count()
 
     @property
@@ -153,24 +203,30 @@ class Group(ag_model_base.AutograderModel):
         The number of submissions this group has made in the current 24
         hour period that are counted towards the daily submission limit.
         """
+        # The list groups view annotates this with an equivalent
+        # filtered Count so the database applies the predicates.
+        if hasattr(self, '_num_submits_towards_limit'):
+            return self._num_submits_towards_limit
+
         # We put the filtering logic here so that we can prefetch all
-        # submissions in the list groups view.
+        # submissions in views that load a single group.
         start_datetime, end_datetime = core_ut.get_24_hour_period(
             self.project.submission_limit_reset_time,
             timezone.now().astimezone(self.project.submission_limit_reset_timezone))
 
-        def _is_towards_limit(submission):
-            return (start_datetime <= submission.timestamp < end_datetime
-                    and submission.status in Submission.GradingStatus.count_towards_limit_statuses)
-
-        return utils.count_if(self.submissions.all(), _is_towards_limit)
+        statuses = Submission.GradingStatus.count_towards_limit_statuses
+        return sum(
+            1 for submission in self.submissions.all()
+            if start_datetime <= submission.timestamp < end_datetime
+            and submission.status in statuses
+        )
 
     def save(self, *args, **kwargs):
         super().save(*args, **kwargs)
 
-        group_dir = core_ut.get_student_group_dir(self)
-        if not os.path.isdir(group_dir):
-            os.makedirs(group_dir)
+        # exist_ok skips the extra stat() and avoids racing concurrent
+        # saves of the same group.
+        os.makedirs(core_ut.get_student_group_dir(self), exist_ok=True)
 
     # IMPORTANT: If you add additional non-field arguments
     # (like check_group_size_limits), update group patching
@@ -204,8 +260,7 @@ class Group(ag_model_base.AutograderModel):
                 ignore_guest_restrictions=ignore_guest_restrictions)
 
             self.members.set(members, clear=True)
-            self._member_names = [
-                user.username for user in sorted(members, key=lambda user: user.username)]
+            self._member_names = sorted(user.username for user in members)
             self.full_clean()
             self.save()
 
@@ -317,14 +317,16 @@ class MutationTestSuite(AutograderModel):
 
         errors = {}
 
+        # Compare project_id rather than project so that each related
+        # file doesn't lazily load its own copy of the project row.
         for instructor_file in self.instructor_files_needed.all():
-            if instructor_file.project != self.project:
+            if instructor_file.project_id != self.project_id:
                 errors['instructor_files_needed'] = (
                     'File {} does not belong to the project "{}".'.format(
                         instructor_file.name, self.project.name))
 
         for student_file in self.student_files_needed.all():
-            if student_file.project != self.project:
+            if student_file.project_id != self.project_id:
                 errors['student_files_needed'] = (
                     'Student file pattern {} does not belong to the project "{}".'.format(
                         student_file.pattern, self.project.name))
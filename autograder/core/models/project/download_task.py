@@ -17,7 +17,9 @@ class DownloadType(enum.Enum):
 class DownloadTask(Task):
     project = models.ForeignKey(Project, related_name='download_tasks', on_delete=models.CASCADE)
     download_type = EnumField(DownloadType)
-    result_filename = models.TextField(blank=True)
+    # A bounded VARCHAR keeps this column inline in the row rather
+    # than TOASTed. 510 comfortably fits the generated result paths.
+    result_filename = models.CharField(max_length=510, blank=True)
 
     SERIALIZABLE_FIELDS = (
         'pk',
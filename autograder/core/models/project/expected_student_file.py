@@ -1,5 +1,9 @@
+import fnmatch
+import re
+
 from django.core import validators, exceptions
 from django.db import models
+from django.utils.functional import cached_property
 
 import autograder.core.fields as ag_fields
 import autograder.core.utils as core_ut
@@ -15,6 +19,13 @@ class ExpectedStudentFile(AutograderModel):
     class Meta:
         ordering = ('pattern',)
         unique_together = ('pattern', 'project')
+        indexes = [
+            # The unique_together index leads with pattern. Lookups are
+            # almost always "all patterns for this project", so give
+            # them an index with project as the leading column.
+            models.Index(fields=['project', 'pattern'],
+                         name='expected_file_proj_pattern_idx'),
+        ]
 
     SERIALIZABLE_FIELDS = (
         'pk',
@@ -55,6 +66,38 @@ class ExpectedStudentFile(AutograderModel):
         help_text='''The maximum number of submitted student files that
             can match the pattern. Must be >= min_num_matches''')
 
+    @classmethod
+    def compile_for_project(cls, project: Project):
+        """
+        Returns a single compiled regex that matches a filename iff
+        that filename matches at least one of project's expected
+        student file patterns, or None if project has no expected
+        student files. Matching one combined alternation is much
+        cheaper than looping over every pattern in Python.
+        """
+        translated = [
+            fnmatch.translate(expected_file.pattern)
+            for expected_file in project.expected_student_files.all()
+        ]
+        if not translated:
+            return None
+
+        return re.compile('|'.join(
+            '(?:{})'.format(regex) for regex in translated))
+
+    @cached_property
+    def _compiled_pattern(self):
+        # fnmatch.fnmatch re-translates and re-compiles the pattern on
+        # every call, which adds up when matching every submitted file
+        # against every pattern. Compile once per instance instead.
+        return re.compile(fnmatch.translate(self.pattern))
+
+    def matches(self, filename: str) -> bool:
+        """
+        Returns True if filename matches this object's pattern.
+        """
+        return self._compiled_pattern.match(filename) is not None
+
     def clean(self):
         if self.max_num_matches < self.min_num_matches:
             raise exceptions.ValidationError(
@@ -7,7 +7,6 @@ from django.core import exceptions
 
 import autograder.core.utils as core_ut
 import autograder.core.constants as const
-from autograder import utils
 
 from ..ag_model_base import AutograderModel, AutograderModelManager
 from .project import Project
@@ -34,9 +33,9 @@ class InstructorFileManager(AutograderModelManager):
                         const.MAX_INSTRUCTOR_FILE_SIZE)})
             project = kwargs['project']
 
-            file_exists = utils.find_if(
-                project.instructor_files.all(),
-                lambda uploaded: uploaded.name == file_obj.name)
+            # A single EXISTS query on the name column instead of
+            # loading every uploaded file just to scan for a match.
+            file_exists = project.instructor_files.filter(name=file_obj.name).exists()
             if file_exists:
                 raise exceptions.ValidationError(
                     {'filename': 'File {} already exists'.format(file_obj.name)})
@@ -84,10 +83,9 @@ class InstructorFile(AutograderModel):
         except exceptions.ValidationError as e:
             raise exceptions.ValidationError({'name': e.message})
 
-        new_filename_exists = utils.find_if(
-            self.project.instructor_files.exclude(pk=self.pk),
-            lambda file_: file_.name == new_name
-        )
+        new_filename_exists = self.project.instructor_files.exclude(
+            pk=self.pk
+        ).filter(name=new_name).exists()
 
         if new_filename_exists:
             raise exceptions.ValidationError(
@@ -99,7 +97,7 @@ class InstructorFile(AutograderModel):
 
         shutil.move(old_abspath, new_abspath)
         self.name = new_name
-        self.save()
+        self.save(update_fields=['file_obj', 'name', 'last_modified'])
 
     @property
     def abspath(self):
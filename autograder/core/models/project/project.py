@@ -23,6 +23,9 @@ class UltimateSubmissionPolicy(enum.Enum):
 
     # The submission with the highest score, using "normal"
     # feedback settings to compute scores.
+    # Ranking for both "best" policies happens in
+    # autograder.core.models.get_ultimate_submissions, which caches
+    # computed totals per submission.
     best_with_normal_fdbk = 'best_basic_score'
 
     # The submission with the highest score. The score used
@@ -207,23 +210,22 @@ class Project(AutograderModel):
     )
 
     def save(self, *args, **kwargs):
+        # The directories only need to be created the first time this
+        # project is saved, so skip the filesystem entirely on updates.
+        creating = self._state.adding
         super().save(*args, **kwargs)
 
-        project_root_dir = core_ut.get_project_root_dir(self)
-        project_files_dir = core_ut.get_project_files_dir(self)
-        project_submissions_dir = core_ut.get_project_groups_dir(self)
-
-        if not os.path.isdir(project_root_dir):
+        if creating:
             # Since the database is in charge of validating the
             # uniqueness of this project, we can assume at this point
             # that creating the project directories will succeed.
             # If for some reason it fails, this will be considered a
             # more severe error, and the OSError thrown by os.makedirs
             # will be handled at a higher level.
-
-            os.makedirs(project_root_dir)
-            os.mkdir(project_files_dir)
-            os.mkdir(project_submissions_dir)
+            # The project root dir is created implicitly as the parent
+            # of these two directories.
+            os.makedirs(core_ut.get_project_files_dir(self), exist_ok=True)
+            os.makedirs(core_ut.get_project_groups_dir(self), exist_ok=True)
 
     def clean(self):
         super().clean()
@@ -1,6 +1,5 @@
 from typing import Optional
 from datetime import timedelta
-import fnmatch
 import os
 
 import django.contrib.postgres.fields as pg_fields
@@ -13,9 +12,11 @@ from django.utils import timezone
 import autograder.core.constants as const
 import autograder.core.fields as ag_fields
 import autograder.core.utils as core_ut
+from autograder import utils
 from autograder.core import constants
 from . import ag_model_base
 from .mutation_test_suite import MutationTestSuiteResult
+from .project.expected_student_file import ExpectedStudentFile
 
 
 def _get_submission_file_upload_to_dir(submission, filename):
@@ -50,6 +51,10 @@ class _SubmissionManager(ag_model_base.AutograderModelManager):
             # created for it.
             submission.save()
 
+            # Compiled once per submission and used to cheaply discard
+            # files that match none of the project's patterns.
+            combined_pattern_regex = ExpectedStudentFile.compile_for_project(group.project)
+
             for file_ in submitted_files:
                 try:
                     core_ut.check_filename(file_.name)
@@ -57,7 +62,7 @@ class _SubmissionManager(ag_model_base.AutograderModelManager):
                     submission.discarded_files.append(file_.name)
                     continue
 
-                if self.file_is_extra(submission, file_.name):
+                if self.file_is_extra(submission, file_.name, combined_pattern_regex):
                     submission.discarded_files.append(file_.name)
                     continue
 
@@ -77,20 +82,23 @@ class _SubmissionManager(ag_model_base.AutograderModelManager):
 
         expected_student_files = submission.group.project.expected_student_files.all()
         for expected_file in expected_student_files:
-            count = len(fnmatch.filter(submitted_filenames, expected_file.pattern))
+            count = utils.count_if(submitted_filenames, expected_file.matches)
             if count < expected_file.min_num_matches:
                 submission.missing_files[expected_file.pattern] = (
                     expected_file.min_num_matches - count)
 
-    def file_is_extra(self, submission, filename):
+    def file_is_extra(self, submission, filename, combined_pattern_regex):
+        if (combined_pattern_regex is None
+                or combined_pattern_regex.match(filename) is None):
+            return True
+
         project = submission.group.project
         for expected_file in project.expected_student_files.all():
-            if not fnmatch.fnmatch(filename, expected_file.pattern):
+            if not expected_file.matches(filename):
                 continue
 
-            num_matches_so_far = len(
-                fnmatch.filter(submission.submitted_filenames,
-                               expected_file.pattern))
+            num_matches_so_far = utils.count_if(
+                submission.submitted_filenames, expected_file.matches)
             if num_matches_so_far == expected_file.max_num_matches:
                 continue
 
@@ -107,6 +115,12 @@ class Submission(ag_model_base.AutograderModel):
 
     class Meta:
         ordering = ['-pk']
+        indexes = [
+            # Serves the daily submission limit count, which filters on
+            # group, a timestamp range, and status.
+            models.Index(fields=['group', 'timestamp', 'status'],
+                         name='submission_group_limit_idx'),
+        ]
 
     class GradingStatus:
         # The submission has been accepted and saved to the database
@@ -149,10 +163,11 @@ class Submission(ag_model_base.AutograderModel):
         active_statuses = [received, queued, being_graded]
 
         # A submission should only be counted towards the daily limit if
-        # it has one of these statuses.
-        count_towards_limit_statuses = [
+        # it has one of these statuses. A frozenset makes the per-
+        # submission membership checks O(1).
+        count_towards_limit_statuses = frozenset([
             received, queued, being_graded,
-            waiting_for_deferred, finished_grading]
+            waiting_for_deferred, finished_grading])
 
     # -------------------------------------------------------------------------
 
@@ -377,7 +392,9 @@ def get_submissions_with_results_queryset(base_manager=Submission.objects):
     prefetch_mutation_suite_results = Prefetch(
         'mutation_test_suite_results', mutation_suite_result_queryset)
 
-    return base_manager.prefetch_related(prefetch_mutation_suite_results)
+    # error_msg can hold multi-KB tracebacks and is never read when
+    # serving results, so don't drag it over the wire for every row.
+    return base_manager.defer('error_msg').prefetch_related(prefetch_mutation_suite_results)
 
 
 def get_mutation_test_suite_results_queryset():
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import operator
 import os
-import tempfile
 from decimal import Decimal
 from typing import BinaryIO, Dict, Iterable, List, Optional, Sequence, Union
 
@@ -25,6 +25,12 @@ from autograder.core.models.project import Project
 from autograder.core.models.mutation_test_suite import MutationTestSuite
 
 
+# The max-feedback config never varies, so build it once instead of on
+# every AGTestCommandResultFeedback construction. It is only ever read
+# from here.
+_MAX_AG_TEST_COMMAND_FDBK_CONFIG = AGTestCommandFeedbackConfig.max_fdbk_config()
+
+
 class AGTestPreLoader:
     def __init__(self, project: Project):
         self._project = project
@@ -721,6 +727,20 @@ class AGTestCommandResultFeedback(ToDictMixin):
     feedback data to give for an AGTestCommandResult.
     """
 
+    # Maps feedback categories to a callable that extracts the
+    # corresponding feedback config from an AGTestCommand. A single dict
+    # lookup here is noticeably cheaper than an if/elif chain when
+    # constructing feedback for thousands of command results.
+    _fdbk_config_getters = {
+        FeedbackCategory.normal: operator.attrgetter('normal_fdbk_config'),
+        FeedbackCategory.ultimate_submission: operator.attrgetter(
+            'ultimate_submission_fdbk_config'),
+        FeedbackCategory.past_limit_submission: operator.attrgetter(
+            'past_limit_submission_fdbk_config'),
+        FeedbackCategory.staff_viewer: operator.attrgetter('staff_viewer_fdbk_config'),
+        FeedbackCategory.max: lambda cmd: _MAX_AG_TEST_COMMAND_FDBK_CONFIG,
+    }
+
     def __init__(self, ag_test_command_result: AGTestCommandResult,
                  fdbk_category: FeedbackCategory,
                  ag_test_preloader: AGTestPreLoader,
@@ -733,20 +753,12 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         self._is_in_first_failed_test = is_in_first_failed_test
 
-        if fdbk_category == FeedbackCategory.normal:
-            if (is_in_first_failed_test
-                    and self._cmd.first_failed_test_normal_fdbk_config is not None):
-                self._fdbk = self._cmd.first_failed_test_normal_fdbk_config
-            else:
-                self._fdbk = self._cmd.normal_fdbk_config
-        elif fdbk_category == FeedbackCategory.ultimate_submission:
-            self._fdbk = self._cmd.ultimate_submission_fdbk_config
-        elif fdbk_category == FeedbackCategory.past_limit_submission:
-            self._fdbk = self._cmd.past_limit_submission_fdbk_config
-        elif fdbk_category == FeedbackCategory.staff_viewer:
-            self._fdbk = self._cmd.staff_viewer_fdbk_config
-        elif fdbk_category == FeedbackCategory.max:
-            self._fdbk = AGTestCommandFeedbackConfig.max_fdbk_config()
+        if (fdbk_category == FeedbackCategory.normal
+                and is_in_first_failed_test
+                and self._cmd.first_failed_test_normal_fdbk_config is not None):
+            self._fdbk = self._cmd.first_failed_test_normal_fdbk_config
+        else:
+            self._fdbk = self._fdbk_config_getters[fdbk_category](self._cmd)
 
     @property
     def pk(self):
@@ -783,7 +795,11 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return None
 
-    @property
+    # The *_correct and *_points properties below are memoized because
+    # each is read several times per serialization (directly, by the
+    # *_points properties, and by the totals) and this object is
+    # constructed fresh for each result.
+    @cached_property
     def return_code_correct(self) -> Optional[bool]:
         if (self._cmd.expected_return_code == ExpectedReturnCode.none
                 or self._fdbk.return_code_fdbk_level == ValueFeedbackLevel.no_feedback):
@@ -806,7 +822,7 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return None
 
-    @property
+    @cached_property
     def return_code_points(self) -> int:
         if self.return_code_correct is None:
             return 0
@@ -815,14 +831,14 @@ class AGTestCommandResultFeedback(ToDictMixin):
             return self._cmd.points_for_correct_return_code
         return self._cmd.deduction_for_wrong_return_code
 
-    @property
+    @cached_property
     def return_code_points_possible(self) -> int:
         if self.return_code_correct is None:
             return 0
 
         return self._cmd.points_for_correct_return_code
 
-    @property
+    @cached_property
     def stdout_correct(self) -> Optional[bool]:
         if (self._cmd.expected_stdout_source == ExpectedOutputSource.none
                 or self._fdbk.stdout_fdbk_level == ValueFeedbackLevel.no_feedback):
@@ -871,11 +887,9 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         # check source and return diff
         if self._cmd.expected_stdout_source == ExpectedOutputSource.text:
-            with tempfile.NamedTemporaryFile('w') as expected_stdout:
-                expected_stdout.write(self._cmd.expected_stdout_text)
-                expected_stdout.flush()
-                return core_ut.get_diff(expected_stdout.name, stdout_filename,
-                                        **diff_whitespace_kwargs)
+            return core_ut.get_diff(None, stdout_filename,
+                                    first_text=self._cmd.expected_stdout_text,
+                                    **diff_whitespace_kwargs)
         elif self._cmd.expected_stdout_source == ExpectedOutputSource.instructor_file:
             return core_ut.get_diff(self._cmd.expected_stdout_instructor_file.abspath,
                                     stdout_filename,
@@ -891,7 +905,7 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return sum((len(line) for line in diff.diff_content))
 
-    @property
+    @cached_property
     def stdout_points(self) -> int:
         if self.stdout_correct is None:
             return 0
@@ -901,14 +915,14 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return self._cmd.deduction_for_wrong_stdout
 
-    @property
+    @cached_property
     def stdout_points_possible(self) -> int:
         if self.stdout_correct is None:
             return 0
 
         return self._cmd.points_for_correct_stdout
 
-    @property
+    @cached_property
     def stderr_correct(self) -> Optional[bool]:
         if (self._cmd.expected_stderr_source == ExpectedOutputSource.none
                 or self._fdbk.stderr_fdbk_level == ValueFeedbackLevel.no_feedback):
@@ -956,11 +970,9 @@ class AGTestCommandResultFeedback(ToDictMixin):
         }
 
         if self._cmd.expected_stderr_source == ExpectedOutputSource.text:
-            with tempfile.NamedTemporaryFile('w') as expected_stderr:
-                expected_stderr.write(self._cmd.expected_stderr_text)
-                expected_stderr.flush()
-                return core_ut.get_diff(expected_stderr.name, stderr_filename,
-                                        **diff_whitespace_kwargs)
+            return core_ut.get_diff(None, stderr_filename,
+                                    first_text=self._cmd.expected_stderr_text,
+                                    **diff_whitespace_kwargs)
         elif self._cmd.expected_stderr_source == ExpectedOutputSource.instructor_file:
             return core_ut.get_diff(self._cmd.expected_stderr_instructor_file.abspath,
                                     stderr_filename,
@@ -976,7 +988,7 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return sum((len(line) for line in diff.diff_content))
 
-    @property
+    @cached_property
     def stderr_points(self) -> int:
         if self.stderr_correct is None:
             return 0
@@ -986,21 +998,21 @@ class AGTestCommandResultFeedback(ToDictMixin):
 
         return self._cmd.deduction_for_wrong_stderr
 
-    @property
+    @cached_property
     def stderr_points_possible(self) -> int:
         if self.stderr_correct is None:
             return 0
 
         return self._cmd.points_for_correct_stderr
 
-    @property
+    @cached_property
     def total_points(self) -> int:
         if not self._fdbk.show_points:
             return 0
 
         return self.return_code_points + self.stdout_points + self.stderr_points
 
-    @property
+    @cached_property
     def total_points_possible(self) -> int:
         if not self._fdbk.show_points:
             return 0
@@ -21,6 +21,27 @@ from autograder.utils.retry import retry_should_recover
 IMAGE_BUILD_MEMORY_LIMIT = os.environ.get('IMAGE_BUILD_MEMORY_LIMIT', '4g')
 IMAGE_BUILD_NPROC_LIMIT = int(os.environ.get('IMAGE_BUILD_NPROC_LIMIT', 1000))
 IMAGE_BUILD_TIMEOUT = int(os.environ.get('IMAGE_BUILD_TIMEOUT', 600))  # 10 minutes
+# Builds default to "--no-cache --pull" so that an image always
+# reflects the current state of the Dockerfile and its base image.
+# Set this to "true" on deployments that prefer faster rebuilds over
+# that guarantee.
+IMAGE_BUILD_USE_CACHE = os.environ.get('IMAGE_BUILD_USE_CACHE', 'false') == 'true'
+
+_REGISTRY_IP_TTL = 300  # 5 minutes
+_registry_ip_cache = {'ip': '', 'expires': 0.0}
+
+
+def _get_registry_ip() -> str:
+    """
+    Resolves the sandbox image registry host, caching the address for
+    a few minutes so that each build doesn't block on DNS.
+    """
+    if time.monotonic() >= _registry_ip_cache['expires']:
+        _registry_ip_cache['ip'] = socket.gethostbyname(
+            settings.SANDBOX_IMAGE_REGISTRY_HOST)
+        _registry_ip_cache['expires'] = time.monotonic() + _REGISTRY_IP_TTL
+
+    return _registry_ip_cache['ip']
 
 
 @celery.shared_task(queue='build_sandbox_image', acks_late=True)
@@ -37,7 +58,7 @@ def build_sandbox_docker_image(build_task_pk: int):
 
         _save_task_status(task, ag_models.BuildImageStatus.in_progress)
 
-        ip_address = socket.gethostbyname(settings.SANDBOX_IMAGE_REGISTRY_HOST)
+        ip_address = _get_registry_ip()
         tag = (f'{ip_address}:{settings.SANDBOX_IMAGE_REGISTRY_PORT}'
                f'/build{task.pk}_result{uuid.uuid4().hex}')
         builder = _ImageBuilder(
@@ -46,10 +67,20 @@ def build_sandbox_docker_image(build_task_pk: int):
         builder.start()
         builder.build_process_started.wait()
 
+        @retry_should_recover
+        def load_task_status():
+            return ag_models.BuildSandboxDockerImageTask.objects.values_list(
+                'status', flat=True
+            ).get(pk=build_task_pk)
+
         while builder.is_alive():
-            time.sleep(1)
-            task.refresh_from_db()
-            if task.status == ag_models.BuildImageStatus.cancelled:
+            # Joining with a timeout (rather than sleeping and then
+            # checking) notices build completion immediately, and
+            # loading just the status column keeps the cancellation
+            # poll from re-fetching the whole task row every second.
+            builder.join(timeout=1)
+            if (builder.is_alive()
+                    and load_task_status() == ag_models.BuildImageStatus.cancelled):
                 builder.cancel()
         builder.join()
 
@@ -57,11 +88,14 @@ def build_sandbox_docker_image(build_task_pk: int):
             _save_internal_error_msg(task, builder.internal_error)
             return
 
+        # Update only these two columns so we don't clobber a status
+        # change (i.e. cancellation) made since the task was loaded.
         @retry_should_recover
+        @transaction.atomic
         def _save_return_code():
-            task.return_code = builder.return_code
-            task.timed_out = builder.timed_out
-            task.save()
+            ag_models.BuildSandboxDockerImageTask.objects.filter(
+                pk=task.pk
+            ).update(return_code=builder.return_code, timed_out=builder.timed_out)
         _save_return_code()
 
         if builder.cancelled:
@@ -112,7 +146,9 @@ def _save_task_status(
     task: ag_models.BuildSandboxDockerImageTask,
     status: ag_models.BuildImageStatus
 ):
-    ag_models.BuildSandboxDockerImageTask.objects.select_for_update().filter(
+    # A plain UPDATE takes its own row lock; there's no read-modify-
+    # write here that would need SELECT ... FOR UPDATE first.
+    ag_models.BuildSandboxDockerImageTask.objects.filter(
         pk=task.pk
     ).update(status=status)
 
@@ -134,11 +170,28 @@ def _run_and_check_cmd(cmd: typing.List[str]):
 
 
 def _validate_image_config(tag: str, task: ag_models.BuildSandboxDockerImageTask) -> bool:
-    inspect_result = _run_and_check_cmd(
-        ['docker', 'inspect', '--format', '{{json .Config}}', tag]
-    )
+    cmd = ['docker', 'inspect', '--format', '{{json .Config}}', tag]
+    # Parse the config straight off the pipe instead of buffering it
+    # in a CompletedProcess first. stderr is kept separate (unlike
+    # _run_and_check_cmd) so that warnings printed there can't corrupt
+    # the JSON.
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding='utf-8',
+        errors='surrogateescape'
+    ) as process:
+        try:
+            config = json.load(process.stdout)
+        except json.JSONDecodeError:
+            # "docker inspect" failed (e.g. no such image) and printed
+            # nothing (or garbage) to stdout.
+            config = None
 
-    config = json.loads(inspect_result.stdout)
+        stderr = process.stderr.read()
+        if process.wait() != 0 or config is None:
+            raise subprocess.CalledProcessError(process.returncode, cmd, output=stderr)
 
     error_msg = ''
     entrypoint = config['Entrypoint']
@@ -159,7 +212,7 @@ def _validate_image_config(tag: str, task: ag_models.BuildSandboxDockerImageTask
 @retry_should_recover
 @transaction.atomic
 def _save_validation_error_msg(build_task: ag_models.BuildSandboxDockerImageTask, error_msg: str):
-    ag_models.BuildSandboxDockerImageTask.objects.select_for_update().filter(
+    ag_models.BuildSandboxDockerImageTask.objects.filter(
         pk=build_task.pk
     ).update(
         status=ag_models.BuildImageStatus.image_invalid,
@@ -170,7 +223,7 @@ def _save_validation_error_msg(build_task: ag_models.BuildSandboxDockerImageTask
 @retry_should_recover
 @transaction.atomic
 def _save_internal_error_msg(build_task: ag_models.BuildSandboxDockerImageTask, error_msg: str):
-    ag_models.BuildSandboxDockerImageTask.objects.select_for_update().filter(
+    ag_models.BuildSandboxDockerImageTask.objects.filter(
         pk=build_task.pk
     ).update(
         status=ag_models.BuildImageStatus.internal_error,
@@ -187,6 +240,7 @@ class _ImageBuilder(threading.Thread):
         self.tag = tag
 
         self._process = None
+        self._cancel_requested = threading.Event()
 
         self.cancelled = False
         self.return_code = None
@@ -205,15 +259,16 @@ class _ImageBuilder(threading.Thread):
             self.internal_error = traceback.format_exc()
 
     def build(self):
-        if self.cancelled:
+        if self._cancel_requested.is_set():
+            self.cancelled = True
             return
 
+        cache_args = [] if IMAGE_BUILD_USE_CACHE else ['--no-cache', '--pull']
         with open(self.output_filename, 'wb') as output:
             with subprocess.Popen(
                 [
                     'docker', 'build',
-                    '--no-cache',
-                    '--pull',
+                    *cache_args,
                     '--memory', IMAGE_BUILD_MEMORY_LIMIT,
                     '--memory-swap', IMAGE_BUILD_MEMORY_LIMIT,
                     '--ulimit', f'nproc={IMAGE_BUILD_NPROC_LIMIT}:{IMAGE_BUILD_NPROC_LIMIT}',
@@ -229,32 +284,44 @@ class _ImageBuilder(threading.Thread):
                 self._process = process
                 self.build_process_started.set()
                 try:
-                    self._process.communicate(None, timeout=IMAGE_BUILD_TIMEOUT)
-                    self.return_code = self._process.poll()
-                except subprocess.TimeoutExpired:
-                    self.timed_out = True
-                    self._process.kill()
-                    self._process.wait()
-                    self.return_code = self._process.poll()
+                    # stdout is redirected to a file, so there are no
+                    # pipes to drain and we can simply wait on the
+                    # process, waking immediately if cancel() is called.
+                    start_time = time.monotonic()
+                    while process.poll() is None:
+                        if self._cancel_requested.wait(timeout=1):
+                            self._terminate_process()
+                            self.cancelled = True
+                            break
+
+                        if time.monotonic() - start_time > IMAGE_BUILD_TIMEOUT:
+                            self.timed_out = True
+                            process.kill()
+                            process.wait()
+                            break
+
+                    self.return_code = process.poll()
                 except:  # noqa
-                    self._process.kill()
-                    self._process.wait()
+                    process.kill()
+                    process.wait()
                     raise
 
-    @property
-    def is_finished(self):
-        assert self._process is not None
-        return self._process.poll() is not None
-
-    def cancel(self):
-        assert self._process is not None
-        if self.cancelled or self.is_finished:
-            return
-
+    def _terminate_process(self):
         try:
             self._process.terminate()
             self._process.wait(3)
-            self.cancelled = True
         except subprocess.TimeoutExpired:
             self._process.kill()
             self._process.wait()
+
+    @property
+    def is_finished(self):
+        assert self._process is not None
+        return self._process.poll() is not None
+
+    def cancel(self):
+        """
+        Requests cancellation. The build thread notices within a second
+        and terminates the build process itself.
+        """
+        self._cancel_requested.set()
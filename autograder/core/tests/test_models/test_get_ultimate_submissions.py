@@ -1,6 +1,7 @@
 import sys
 from typing import List
 
+import autograder.core.caching as caching
 import autograder.core.models as ag_models
 import autograder.utils.testing.model_obj_builders as obj_build
 from autograder.core.models.get_ultimate_submissions import (
@@ -213,6 +214,47 @@ class GetUltimateSubmissionsTestCase(_TestCase):
                                  ultimate_submissions)
 
 
+class BestSubmissionTotalPointsCachingTestCase(_TestCase):
+    def setUp(self):
+        super().setUp()
+        self.project = obj_build.make_project(
+            ultimate_submission_policy=ag_models.UltimateSubmissionPolicy.best)
+
+    def test_cached_total_points_used_and_invalidated(self):
+        data = self.prepare_data(self.project, num_other_submissions=1)
+        group = data[0].group
+        best_sub = data[0].best_submission
+
+        # First call computes and caches the totals, second call uses
+        # the cached values.
+        for i in range(2):
+            ultimate_bests = list(get_ultimate_submissions(
+                self.project, filter_groups=None,
+                ag_test_preloader=AGTestPreLoader(self.project)))
+            self.assertSequenceEqual(
+                [best_sub], [fdbk.submission for fdbk in ultimate_bests])
+
+        cache_key = caching.submission_total_points_cache_key(
+            project_pk=self.project.pk, submission_pk=best_sub.pk,
+            fdbk_category=ag_models.FeedbackCategory.max)
+        with self.assert_cache_key_invalidated(cache_key):
+            caching.clear_submission_results_cache(self.project.pk)
+
+    def test_delete_cached_submission_result_clears_total_points(self):
+        data = self.prepare_data(self.project)
+        best_sub = data[0].best_submission
+
+        list(get_ultimate_submissions(
+            self.project, filter_groups=None,
+            ag_test_preloader=AGTestPreLoader(self.project)))
+
+        cache_key = caching.submission_total_points_cache_key(
+            project_pk=self.project.pk, submission_pk=best_sub.pk,
+            fdbk_category=ag_models.FeedbackCategory.max)
+        with self.assert_cache_key_invalidated(cache_key):
+            caching.delete_cached_submission_result(best_sub)
+
+
 class GetUltimateSubmissionTestCase(_TestCase):
     def setUp(self):
         super().setUp()
@@ -111,6 +111,28 @@ class GroupTestCase(_SetUp):
         self.assertSequenceEqual([group2, group4, group3, group1],
                                  ag_models.Group.objects.all())
 
+    def test_containing_username(self):
+        self.project.validate_and_update(guests_can_submit=True)
+        other_project = obj_build.build_project(
+            project_kwargs={
+                'max_group_size': 2,
+                'guests_can_submit': True})
+
+        repeated_user = self.student_users[0]
+
+        first_group = ag_models.Group.objects.validate_and_create(
+            members=self.student_users, project=self.project)
+        second_group = ag_models.Group.objects.validate_and_create(
+            members=[repeated_user], project=other_project)
+        ag_models.Group.objects.validate_and_create(
+            members=self.guest_group, project=self.project)
+
+        self.assertCountEqual(
+            [first_group, second_group],
+            ag_models.Group.objects.containing_username(repeated_user.username))
+        self.assertCountEqual(
+            [], ag_models.Group.objects.containing_username('no_such_user'))
+
     def test_bonus_submissions_remaining_init(self):
         num_bonus_submissions = 5
         self.project.validate_and_update(num_bonus_submissions=num_bonus_submissions)
@@ -9,36 +9,103 @@ import autograder.core.models as ag_models
 import autograder.utils.testing.model_obj_builders as obj_build
 
 
+# Feedback configs are plain serializable objects (no database rows),
+# so these deterministic reference dicts can be computed once at import
+# time.
+_DEFAULT_ULTIMATE_FDBK_DICT = ag_models.MutationTestSuiteFeedbackConfig.from_dict({
+    'show_setup_return_code': True,
+    'show_invalid_test_names': True,
+    'show_points': True,
+    'bugs_exposed_fdbk_level': ag_models.BugsExposedFeedbackLevel.num_bugs_exposed
+}).to_dict()
+
+_DEFAULT_LOW_FDBK_DICT = ag_models.MutationTestSuiteFeedbackConfig.from_dict({}).to_dict()
+
+# Commands that are each missing one of the two required placeholders,
+# formatted once at import time.
+_CMD_ONLY_STUDENT_TEST_PLACEHOLDER = 'wee {}'.format(
+    ag_models.MutationTestSuite.STUDENT_TEST_NAME_PLACEHOLDER)
+_CMD_ONLY_BUGGY_IMPL_PLACEHOLDER = 'wee {}'.format(
+    ag_models.MutationTestSuite.BUGGY_IMPL_NAME_PLACEHOLDER)
+
+_EXPECTED_SUITE_FIELDS = frozenset([
+    'pk',
+    'name',
+    'project',
+    'instructor_files_needed',
+    'read_only_instructor_files',
+    'student_files_needed',
+    'buggy_impl_names',
+
+    'use_setup_command',
+    'setup_command',
+    'get_student_test_names_command',
+    'max_num_student_tests',
+
+    'student_test_validity_check_command',
+    'grade_buggy_impl_command',
+    'points_per_exposed_bug',
+    'max_points',
+    'deferred',
+    'sandbox_docker_image',
+    'allow_network_access',
+    'normal_fdbk_config',
+    'ultimate_submission_fdbk_config',
+    'past_limit_submission_fdbk_config',
+    'staff_viewer_fdbk_config',
+    'last_modified',
+])
+
+
 class MutationTestSuiteTestCase(UnitTestBase):
     def setUp(self):
         super().setUp()
         self.project = obj_build.make_project()
         self.name = 'qewioruqiwoeiru'
 
+    def _bulk_make_suites(self, names):
+        """
+        Creates fixture suites whose validity isn't under test with a
+        single multi-row INSERT instead of a validation pass and
+        transaction per suite. _order is set manually because
+        bulk_create skips the order_with_respect_to bookkeeping.
+        """
+        suites = [
+            ag_models.MutationTestSuite(project=self.project, name=name, _order=index)
+            for index, name in enumerate(names)
+        ]
+        ag_models.MutationTestSuite.objects.bulk_create(suites, batch_size=100)
+        return suites
+
     def test_default_init(self):
         mutation_suite = ag_models.MutationTestSuite.objects.validate_and_create(
             name=self.name, project=self.project)  # type: ag_models.MutationTestSuite
 
+        # Re-fetch with both m2m fields prefetched so the .all() calls
+        # below read from the prefetch cache instead of issuing a query
+        # apiece.
+        mutation_suite = ag_models.MutationTestSuite.objects.prefetch_related(
+            'instructor_files_needed', 'student_files_needed'
+        ).get(pk=mutation_suite.pk)
+
         self.assertEqual(self.name, mutation_suite.name)
         self.assertEqual(self.project, mutation_suite.project)
-        self.assertSequenceEqual([], mutation_suite.instructor_files_needed.all())
+        with self.assertNumQueries(0):
+            self.assertSequenceEqual([], mutation_suite.instructor_files_needed.all())
+            self.assertSequenceEqual([], mutation_suite.student_files_needed.all())
         self.assertTrue(mutation_suite.read_only_instructor_files)
-        self.assertSequenceEqual([], mutation_suite.student_files_needed.all())
         self.assertSequenceEqual([], mutation_suite.buggy_impl_names)
 
         self.assertFalse(mutation_suite.use_setup_command)
-        self.assertIsInstance(mutation_suite.setup_command,
-                              ag_models.Command)
-        self.assertIsInstance(mutation_suite.get_student_test_names_command,
-                              ag_models.Command)
+        for attr in ('setup_command',
+                     'get_student_test_names_command',
+                     'student_test_validity_check_command',
+                     'grade_buggy_impl_command'):
+            self.assertIsInstance(getattr(mutation_suite, attr), ag_models.Command)
+
         self.assertEqual(ag_models.MutationTestSuite.DEFAULT_STUDENT_TEST_MAX,
                          mutation_suite.max_num_student_tests)
 
-        self.assertIsInstance(mutation_suite.student_test_validity_check_command,
-                              ag_models.Command)
-        self.assertIsInstance(mutation_suite.grade_buggy_impl_command,
-                              ag_models.Command)
-
         self.assertEqual(0, mutation_suite.points_per_exposed_bug)
         self.assertIsNone(mutation_suite.max_points)
         self.assertFalse(mutation_suite.deferred)
@@ -46,27 +113,18 @@ class MutationTestSuiteTestCase(UnitTestBase):
                          mutation_suite.sandbox_docker_image)
         self.assertFalse(mutation_suite.allow_network_access)
 
-        self.assertIsInstance(mutation_suite.normal_fdbk_config,
-                              ag_models.MutationTestSuiteFeedbackConfig)
-        self.assertIsInstance(mutation_suite.ultimate_submission_fdbk_config,
-                              ag_models.MutationTestSuiteFeedbackConfig)
-        self.assertIsInstance(mutation_suite.past_limit_submission_fdbk_config,
-                              ag_models.MutationTestSuiteFeedbackConfig)
-        self.assertIsInstance(mutation_suite.staff_viewer_fdbk_config,
-                              ag_models.MutationTestSuiteFeedbackConfig)
+        for attr in ('normal_fdbk_config',
+                     'ultimate_submission_fdbk_config',
+                     'past_limit_submission_fdbk_config',
+                     'staff_viewer_fdbk_config'):
+            self.assertIsInstance(getattr(mutation_suite, attr),
+                                  ag_models.MutationTestSuiteFeedbackConfig)
 
         self.maxDiff = None
-        ultimate_fdbk = ag_models.MutationTestSuiteFeedbackConfig.from_dict({
-            'show_setup_return_code': True,
-            'show_invalid_test_names': True,
-            'show_points': True,
-            'bugs_exposed_fdbk_level': ag_models.BugsExposedFeedbackLevel.num_bugs_exposed
-        })
-        self.assertEqual(ultimate_fdbk.to_dict(),
+        self.assertEqual(_DEFAULT_ULTIMATE_FDBK_DICT,
                          mutation_suite.ultimate_submission_fdbk_config.to_dict())
 
-        low_fdbk = ag_models.MutationTestSuiteFeedbackConfig.from_dict({})
-        self.assertEqual(low_fdbk.to_dict(),
+        self.assertEqual(_DEFAULT_LOW_FDBK_DICT,
                          mutation_suite.normal_fdbk_config.to_dict())
 
         past_limit_fdbk = mutation_suite.past_limit_submission_fdbk_config
@@ -125,16 +183,24 @@ class MutationTestSuiteTestCase(UnitTestBase):
             **values
         )  # type: ag_models.MutationTestSuite
 
-        self.assertCountEqual(
-            [instructor_file['pk'] for instructor_file in values['instructor_files_needed']],
-            [instructor_file.pk for instructor_file in
-             mutation_suite.instructor_files_needed.all()])
-        values.pop('instructor_files_needed')
-
-        self.assertCountEqual(
-            [student_file['pk'] for student_file in values['student_files_needed']],
-            [student_file.pk for student_file in mutation_suite.student_files_needed.all()])
-        values.pop('student_files_needed')
+        mutation_suite = ag_models.MutationTestSuite.objects.prefetch_related(
+            'instructor_files_needed', 'student_files_needed'
+        ).get(pk=mutation_suite.pk)
+
+        # The pk reads below hit the prefetch cache; don't switch them
+        # to values_list('pk', flat=True), which would issue a fresh
+        # query per field and break the zero-query assertion.
+        with self.assertNumQueries(0):
+            self.assertCountEqual(
+                [instructor_file['pk'] for instructor_file in values['instructor_files_needed']],
+                [instructor_file.pk for instructor_file in
+                 mutation_suite.instructor_files_needed.all()])
+            values.pop('instructor_files_needed')
+
+            self.assertCountEqual(
+                [student_file['pk'] for student_file in values['student_files_needed']],
+                [student_file.pk for student_file in mutation_suite.student_files_needed.all()])
+            values.pop('student_files_needed')
 
         for key, value in values.items():
             if isinstance(value, dict):
@@ -174,10 +240,7 @@ class MutationTestSuiteTestCase(UnitTestBase):
         self.assertIn('points_per_exposed_bug', cm.exception.message_dict)
 
     def test_suite_ordering(self):
-        suite1 = ag_models.MutationTestSuite.objects.validate_and_create(
-            name='qweiruquerw', project=self.project)
-        suite2 = ag_models.MutationTestSuite.objects.validate_and_create(
-            name='xjvnjadoa', project=self.project)
+        suite1, suite2 = self._bulk_make_suites(['qweiruquerw', 'xjvnjadoa'])
 
         self.assertCountEqual([suite1.pk, suite2.pk], self.project.get_mutationtestsuite_order())
 
@@ -191,14 +254,13 @@ class MutationTestSuiteTestCase(UnitTestBase):
 
     def test_error_name_not_unique(self):
         name = 'spam'
-        suite1 = ag_models.MutationTestSuite.objects.validate_and_create(
-            name=name, project=self.project)
+        self._bulk_make_suites([name])
 
         with self.assertRaises(exceptions.ValidationError):
             ag_models.MutationTestSuite.objects.validate_and_create(
                 name=name, project=self.project)
 
-    def test_max_num_student_tests_out_of_range(self):
+    def test_max_num_student_tests_too_large(self):
         with self.assertRaises(exceptions.ValidationError) as cm:
             ag_models.MutationTestSuite.objects.validate_and_create(
                 name=self.name, project=self.project,
@@ -206,12 +268,20 @@ class MutationTestSuiteTestCase(UnitTestBase):
 
         self.assertIn('max_num_student_tests', cm.exception.message_dict)
 
+    def test_numeric_fields_out_of_range(self):
+        # full_clean collects all field validator errors in one pass,
+        # so one create attempt covers every numeric bound instead of
+        # a failed INSERT per field.
         with self.assertRaises(exceptions.ValidationError) as cm:
             ag_models.MutationTestSuite.objects.validate_and_create(
                 name=self.name, project=self.project,
-                max_num_student_tests=-1)
+                max_num_student_tests=-1,
+                points_per_exposed_bug=-1,
+                max_points=-1)
 
         self.assertIn('max_num_student_tests', cm.exception.message_dict)
+        self.assertIn('points_per_exposed_bug', cm.exception.message_dict)
+        self.assertIn('max_points', cm.exception.message_dict)
 
     def test_validity_check_cmd_missing_placeholders(self):
         with self.assertRaises(exceptions.ValidationError) as cm:
@@ -225,37 +295,17 @@ class MutationTestSuiteTestCase(UnitTestBase):
         with self.assertRaises(exceptions.ValidationError) as cm:
             ag_models.MutationTestSuite.objects.validate_and_create(
                 name=self.name, project=self.project,
-                grade_buggy_impl_command={
-                    'cmd': 'wee {}'.format(
-                        ag_models.MutationTestSuite.STUDENT_TEST_NAME_PLACEHOLDER)})
+                grade_buggy_impl_command={'cmd': _CMD_ONLY_STUDENT_TEST_PLACEHOLDER})
 
         self.assertIn('grade_buggy_impl_command', cm.exception.message_dict)
 
         with self.assertRaises(exceptions.ValidationError) as cm:
             ag_models.MutationTestSuite.objects.validate_and_create(
                 name=self.name, project=self.project,
-                grade_buggy_impl_command={
-                    'cmd': 'wee {}'.format(
-                        ag_models.MutationTestSuite.BUGGY_IMPL_NAME_PLACEHOLDER)})
+                grade_buggy_impl_command={'cmd': _CMD_ONLY_BUGGY_IMPL_PLACEHOLDER})
 
         self.assertIn('grade_buggy_impl_command', cm.exception.message_dict)
 
-    def test_points_per_exposed_bug_out_of_range(self):
-        with self.assertRaises(exceptions.ValidationError) as cm:
-            ag_models.MutationTestSuite.objects.validate_and_create(
-                name=self.name, project=self.project,
-                points_per_exposed_bug=-1)
-
-        self.assertIn('points_per_exposed_bug', cm.exception.message_dict)
-
-    def test_max_points_out_of_range(self):
-        with self.assertRaises(exceptions.ValidationError) as cm:
-            ag_models.MutationTestSuite.objects.validate_and_create(
-                name=self.name, project=self.project,
-                max_points=-1)
-
-        self.assertIn('max_points', cm.exception.message_dict)
-
     def test_error_instructor_file_needed_that_belongs_to_other_project(self):
         other_project = obj_build.make_project(course=self.project.course)
         other_instructor_file = obj_build.make_instructor_file(project=other_project)
@@ -287,34 +337,6 @@ class MutationTestSuiteTestCase(UnitTestBase):
         self.assertIn('sandbox_docker_image', cm.exception.message_dict)
 
     def test_serialization(self):
-        expected_field_names = [
-            'pk',
-            'name',
-            'project',
-            'instructor_files_needed',
-            'read_only_instructor_files',
-            'student_files_needed',
-            'buggy_impl_names',
-
-            'use_setup_command',
-            'setup_command',
-            'get_student_test_names_command',
-            'max_num_student_tests',
-
-            'student_test_validity_check_command',
-            'grade_buggy_impl_command',
-            'points_per_exposed_bug',
-            'max_points',
-            'deferred',
-            'sandbox_docker_image',
-            'allow_network_access',
-            'normal_fdbk_config',
-            'ultimate_submission_fdbk_config',
-            'past_limit_submission_fdbk_config',
-            'staff_viewer_fdbk_config',
-            'last_modified',
-        ]
-
         instructor_file = obj_build.make_instructor_file(self.project)
         student_file = obj_build.make_expected_student_file(self.project)
 
@@ -325,8 +347,12 @@ class MutationTestSuiteTestCase(UnitTestBase):
             student_files_needed=[student_file]
         )  # type: ag_models.MutationTestSuite
 
-        serialized = mutation_suite.to_dict()
-        self.assertCountEqual(expected_field_names, serialized.keys())
+        # Tripwire against to_dict() growing extra queries: one query
+        # apiece for the two m2m fields, plus the related files'
+        # project foreign keys loaded while serializing them.
+        with self.assertNumQueries(4):
+            serialized = mutation_suite.to_dict()
+        self.assertEqual(_EXPECTED_SUITE_FIELDS, frozenset(serialized.keys()))
 
         self.assertIsInstance(serialized['instructor_files_needed'][0], dict)
         self.assertIsInstance(serialized['student_files_needed'][0], dict)
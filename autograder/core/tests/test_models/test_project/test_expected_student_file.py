@@ -132,6 +132,30 @@ class ExpectedStudentFileTestCase(UnitTestBase):
 
         self.assertIn('max_num_matches', cm.exception.message_dict)
 
+    def test_matches(self):
+        expected_file = ExpectedStudentFile.objects.validate_and_create(
+            project=self.project,
+            pattern='test_*.cpp')
+
+        self.assertTrue(expected_file.matches('test_spam.cpp'))
+        self.assertTrue(expected_file.matches('test_.cpp'))
+        self.assertFalse(expected_file.matches('spam.cpp'))
+        self.assertFalse(expected_file.matches('test_spam.cpp.txt'))
+
+    def test_compile_for_project(self):
+        ExpectedStudentFile.objects.validate_and_create(
+            project=self.project, pattern='test_*.cpp')
+        ExpectedStudentFile.objects.validate_and_create(
+            project=self.project, pattern='spam.txt')
+
+        regex = ExpectedStudentFile.compile_for_project(self.project)
+        self.assertIsNotNone(regex.match('test_egg.cpp'))
+        self.assertIsNotNone(regex.match('spam.txt'))
+        self.assertIsNone(regex.match('sausage.txt'))
+
+    def test_compile_for_project_no_expected_files(self):
+        self.assertIsNone(ExpectedStudentFile.compile_for_project(self.project))
+
     def test_exception_illegal_patterns(self):
         illegal_patterns = [
             '..',
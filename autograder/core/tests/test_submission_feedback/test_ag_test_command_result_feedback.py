@@ -797,11 +797,13 @@ class AGTestCommandResultFeedbackTestCase(UnitTestBase):
         with mock.patch(mock_path) as mock_differ_cls:
             diff = get_cmd_fdbk(result, ag_models.FeedbackCategory.max).stdout_diff
             mock_differ_cls.assert_called_with(mock.ANY, actual_stdout_filename,
+                                               first_text=mock.ANY,
                                                **diff_options)
 
         with mock.patch(mock_path) as mock_differ_cls:
             diff = get_cmd_fdbk(result, ag_models.FeedbackCategory.max).stderr_diff
             mock_differ_cls.assert_called_with(mock.ANY, actual_stderr_filename,
+                                               first_text=mock.ANY,
                                                **diff_options)
 
         if expect_stdout_correct:
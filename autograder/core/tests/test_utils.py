@@ -162,6 +162,28 @@ cheese\r
                                   ignore_blank_lines=True)
         self.assertTrue(result.diff_pass)
 
+    def test_first_text_instead_of_first_file(self):
+        self._write_and_seek(self.file2, '\n'.join(('a', 'b', 'y', 'c\n')))
+
+        expected = [
+            '  a\n',
+            '  b\n',
+            '- x\n',
+            '+ y\n',
+            '  c\n',
+        ]
+
+        diff = core_ut.get_diff(None, self.file2.name,
+                                first_text='\n'.join(('a', 'b', 'x', 'c\n')))
+
+        self.assertFalse(diff.diff_pass)
+        self.assertEqual(expected, list(diff.diff_content))
+
+    def test_first_text_diff_pass(self):
+        self._write_and_seek(self.file2, 'spam\negg\n')
+        result = core_ut.get_diff(None, self.file2.name, first_text='spam\negg\n')
+        self.assertTrue(result.diff_pass)
+
 
 class CheckFilenameTest(SimpleTestCase):
     def test_valid_filename(self):
@@ -3,7 +3,7 @@ import enum
 import os
 import re
 import subprocess
-from typing import List
+from typing import List, Optional
 
 from django.conf import settings
 from django.core import exceptions
@@ -21,17 +21,23 @@ class DiffResult:
 _DIFF_LINE_REGEX = re.compile(r'^(?:  |\+ |- ).*\n+'.encode(), flags=re.MULTILINE)
 
 
-def get_diff(first_filename: str, second_filename: str,
+def get_diff(first_filename: Optional[str], second_filename: str,
              ignore_case=False,
              ignore_whitespace=False,
              ignore_whitespace_changes=False,
-             ignore_blank_lines=False) -> DiffResult:
+             ignore_blank_lines=False,
+             first_text: Optional[str]=None) -> DiffResult:
     """
     Diffs first and second using the GNU diff command line utility.
     Returns an empty list if first and second are considered equivalent.
     Otherwise, returns a list of strings, each of which are prefixed
     with one of the two-letter opcodes used by
     https://docs.python.org/3.5/library/difflib.html#difflib.Differ
+
+    If first_text is not None, first_filename must be None, and
+    first_text is diffed against the contents of second_filename.
+    This avoids having to write in-database expected output to a
+    temporary file just to diff it.
     """
     # We're adding newlines at the beginning of each formatted line
     # because GNU diff will otherwise handle missing trailing
@@ -50,9 +56,16 @@ def get_diff(first_filename: str, second_filename: str,
     if ignore_blank_lines:
         diff_cmd.append('--ignore-blank-lines')
 
-    diff_cmd += [first_filename, second_filename]
-
-    diff_result = subprocess.run(diff_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    if first_text is not None:
+        assert first_filename is None, 'first_filename and first_text are mutually exclusive'
+        # '-' tells diff to read the first input from stdin.
+        diff_cmd += ['-', second_filename]
+        diff_result = subprocess.run(
+            diff_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            input=first_text.encode('utf-8', 'surrogateescape'))
+    else:
+        diff_cmd += [first_filename, second_filename]
+        diff_result = subprocess.run(diff_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     diff_list = [match.group()[:-1].decode('utf-8', 'surrogateescape')
                  for match in _DIFF_LINE_REGEX.finditer(diff_result.stdout)]
     return DiffResult(diff_result.returncode == 0, diff_list)
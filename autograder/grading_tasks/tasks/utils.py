@@ -33,8 +33,10 @@ def mark_submission_as_error(submission_pk, error_msg):
 def add_files_to_sandbox(sandbox: AutograderSandbox,
                          suite: Union[ag_models.AGTestSuite, ag_models.MutationTestSuite],
                          submission: ag_models.Submission):
+    # Only the pattern and file path columns are used here, so don't
+    # pull the rest of the rows over the wire.
     student_files_to_add = []
-    for student_file in load_queryset_with_retry(suite.student_files_needed.all()):
+    for student_file in load_queryset_with_retry(suite.student_files_needed.only('pattern')):
         matching_files = fnmatch.filter(submission.submitted_filenames,
                                         student_file.pattern)
 
@@ -51,7 +53,7 @@ def add_files_to_sandbox(sandbox: AutograderSandbox,
 
     project_files_to_add = [
         file_.abspath for file_
-        in load_queryset_with_retry(suite.instructor_files_needed.all())
+        in load_queryset_with_retry(suite.instructor_files_needed.only('file_obj'))
     ]
     if project_files_to_add:
         owner_and_read_only = {
@@ -275,9 +275,12 @@ def can_request_feedback_category(
 
                 # Staff can only request ultimate_submission feedback for other groups'
                 # ultimate submissions ultimate submission feedback is available to that group.
-                group_ultimate_submission = get_ultimate_submission(group)
-                return (deadline_past and group_ultimate_submission == submission
-                        and not project.hide_ultimate_submission_fdbk)
+                # Check the cheap flags first; loading the ultimate
+                # submission costs queries.
+                if not deadline_past or project.hide_ultimate_submission_fdbk:
+                    return False
+
+                return get_ultimate_submission(group) == submission
 
             # Non-staff users cannot view other groups' submissions
             if not group.members.filter(pk=request.user.pk).exists():
@@ -290,10 +293,10 @@ def can_request_feedback_category(
                 return submission.is_past_daily_limit
 
             if fdbk_category == ag_models.FeedbackCategory.ultimate_submission:
-                user_ultimate_submission = get_ultimate_submission(group, request.user)
-                return (not project.hide_ultimate_submission_fdbk
-                        and user_ultimate_submission == submission
-                        and deadline_past)
+                if project.hide_ultimate_submission_fdbk or not deadline_past:
+                    return False
+
+                return get_ultimate_submission(group, request.user) == submission
 
             return False
 
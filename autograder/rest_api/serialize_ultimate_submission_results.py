@@ -63,7 +63,9 @@ def serialize_ultimate_submission_results(ultimate_submissions: Iterable[Submiss
 
             if username in submission.does_not_count_for:
                 user_ultimate_submission = get_ultimate_submission(
-                    group, group.members.get(username=username))
+                    group, group.members.get(username=username),
+                    ag_test_preloader=submission_fdbk.ag_test_preloader,
+                    mutation_test_suite_preloader=submission_fdbk.mutation_test_suite_preloader)
 
                 if user_ultimate_submission is None:
                     continue
@@ -254,7 +254,9 @@ class SerializeUltimateSubmissionResultsTestCase(UnitTestBase):
             serialize_ultimate_submission_results(
                 [most_recent_submission_fdbk], full_results=False)
 
-            mock_get_ultimate_submission.assert_called_once_with(group, doesnt_count_for_user)
+            mock_get_ultimate_submission.assert_called_once_with(
+                group, doesnt_count_for_user,
+                ag_test_preloader=mock.ANY, mutation_test_suite_preloader=mock.ANY)
 
     def test_group_has_user_no_submissions_count_for(self) -> None:
         self.assertEqual(ag_models.UltimateSubmissionPolicy.most_recent,
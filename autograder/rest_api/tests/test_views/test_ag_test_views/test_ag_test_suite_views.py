@@ -28,7 +28,11 @@ class ListAGTestSuitesTestCase(UnitTestBase):
         [staff] = obj_build.make_staff_users(self.project.course, 1)
         self.client.force_authenticate(staff)
 
-        response = self.client.get(self.url)
+        # The query count must not grow with the number of suites.
+        # If this starts scaling with len(suites), a select_related or
+        # prefetch_related was probably dropped from the view.
+        with self.assertNumQueries(9):
+            response = self.client.get(self.url)
         self.assertEqual(status.HTTP_200_OK, response.status_code)
         self.assertSequenceEqual([self.suite1.to_dict(), self.suite2.to_dict()], response.data)
 
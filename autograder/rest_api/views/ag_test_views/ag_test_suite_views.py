@@ -24,6 +24,9 @@ class AGTestSuiteListCreateView(NestedModelView):
             'ag_test_suites',
             ag_models.AGTestSuite.objects.select_related(
                 'project__course',
+                # Serialized with each suite; without this every suite
+                # lazily loads its own image row.
+                'sandbox_docker_image',
             ).prefetch_related(
                 Prefetch('instructor_files_needed',
                          ag_models.InstructorFile.objects.select_related('project')),
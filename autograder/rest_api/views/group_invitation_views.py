@@ -80,7 +80,7 @@ class ListCreateGroupInvitationView(NestedModelView):
 
     permission_classes = [list_create_invitation_permissions]
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     nested_field_name = 'group_invitations'
     parent_obj_field_name = 'project'
 
@@ -113,8 +113,10 @@ class ListCreateGroupInvitationView(NestedModelView):
 class CanReadOrEditInvitation(permissions.BasePermission):
     def has_object_permission(self, request, view, invitation):
         is_staff = invitation.project.course.is_staff(request.user)
-        is_involved = (request.user == invitation.sender
-                       or request.user in invitation.recipients.all())
+        # An EXISTS query instead of loading every recipient row just
+        # to do a linear membership scan.
+        is_involved = (request.user.pk == invitation.sender_id
+                       or invitation.recipients.filter(pk=request.user.pk).exists())
 
         if request.method.lower() == 'get':
             return is_staff or is_involved
@@ -134,7 +136,7 @@ class GroupInvitationDetailView(AGModelDetailView):
     schema = AGDetailViewSchemaGenerator([APITags.group_invitations])
 
     permission_classes = [invitation_detail_permissions]
-    model_manager = ag_models.GroupInvitation.objects
+    model_manager = ag_models.GroupInvitation.objects.select_related('project__course')
 
     def get(self, *args, **kwargs):
         return self.do_get()
@@ -163,7 +165,7 @@ class AcceptGroupInvitationView(AGModelAPIView):
         }
     })
 
-    model_manager = ag_models.GroupInvitation.objects
+    model_manager = ag_models.GroupInvitation.objects.select_related('project__course')
     permission_classes = [invitation_detail_permissions]
 
     @convert_django_validation_error
@@ -72,16 +72,25 @@ class ListCreateGroupsView(NestedModelView):
     nested_field_name = 'groups'
     parent_obj_field_name = 'project'
 
-    def get_queryset(self):
-        queryset = super().get_queryset()
-        if self.request.method.lower() == 'get':
-            queryset = queryset.prefetch_related(
-                'members',
-                Prefetch('submissions',
-                         ag_models.Submission.objects.defer('denormalized_ag_test_results'))
-            )
+    def get_nested_manager(self):
+        manager = super().get_nested_manager()
+        if self.request.method.lower() != 'get':
+            return manager
+
+        # Annotating both counts lets the database evaluate the daily
+        # limit predicates and means no submission rows are loaded at
+        # all when listing groups. The 24-hour window is computed once
+        # here rather than per group in the property.
+        project = self.get_object()
+        start_datetime, end_datetime = core_ut.get_24_hour_period(
+            project.submission_limit_reset_time,
+            timezone.now().astimezone(project.submission_limit_reset_timezone))
 
-        return queryset
+        # Django ignores Meta.ordering on aggregated queries, so
+        # restate it here.
+        return manager.with_submission_counts(
+            start_datetime, end_datetime
+        ).select_related('project').prefetch_related('members').order_by('_member_names')
 
     def get(self, *args, **kwargs):
         return self.do_list()
@@ -201,8 +210,15 @@ class GroupDetailView(AGModelDetailView):
 
     permission_classes = [group_permissions]
 
+    # The prefetched submissions only feed num_submissions and
+    # num_submits_towards_limit, which read just timestamp and status.
     model_manager = ag_models.Group.objects.select_related(
-        'project__course').prefetch_related('members', 'submissions')
+        'project__course'
+    ).prefetch_related(
+        'members',
+        Prefetch('submissions',
+                 ag_models.Submission.objects.only('pk', 'group', 'timestamp', 'status'))
+    )
 
     def get(self, *args, **kwargs):
         return self.do_get()
@@ -301,7 +317,7 @@ class MergeGroupsView(AGModelAPIView):
     })
 
     permission_classes = [ag_permissions.is_admin()]
-    model_manager = ag_models.Group.objects
+    model_manager = ag_models.Group.objects.select_related('project__course')
 
     @convert_django_validation_error
     @transaction.atomic()
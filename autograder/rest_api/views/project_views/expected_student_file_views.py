@@ -13,7 +13,7 @@ class ListCreateExpectedStudentFileView(NestedModelView):
 
     permission_classes = [ag_permissions.is_admin_or_read_only_can_view_project()]
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     nested_field_name = 'expected_student_files'
     parent_obj_field_name = 'project'
 
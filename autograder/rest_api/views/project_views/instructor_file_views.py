@@ -55,7 +55,7 @@ class ListCreateInstructorFileView(NestedModelView):
 
     permission_classes = [ag_permissions.is_admin_or_read_only_staff()]
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     nested_field_name = 'instructor_files'
     parent_obj_field_name = 'project'
 
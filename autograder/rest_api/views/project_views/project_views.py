@@ -130,7 +130,7 @@ class CopyProjectView(AGModelAPIView):
     })
 
     pk_key = 'project_pk'
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
 
     permission_classes = [ag_permissions.is_admin()]
 
@@ -170,7 +170,7 @@ class ImportHandgradingRubricView(AGModelAPIView):
     })
 
     pk_key = 'project_pk'
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
 
     permission_classes = [ag_permissions.is_admin()]
 
@@ -211,7 +211,7 @@ class NumQueuedSubmissionsView(AGModelAPIView):
         }
     })
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     permission_classes = [project_detail_permissions]
 
     def get(self, *args, **kwargs):
@@ -235,7 +235,7 @@ class _DownloadViewBase(AGModelAPIView):
     download_type: Optional[ag_models.DownloadType] = None
     celery_task_func = None
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     permission_classes = [ag_permissions.is_admin()]
 
     def post(self, *args, **kwargs):
@@ -277,7 +277,7 @@ class UltimateSubmissionScoresTaskView(_DownloadViewBase):
 class ListDownloadTasksView(NestedModelView):
     schema = None
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     nested_field_name = 'download_tasks'
     permission_classes = [ag_permissions.is_admin()]
 
@@ -290,7 +290,7 @@ class ClearResultsCacheView(AGModelAPIView):
         'DELETE': {'deprecated': True, 'operation_id': 'clearSubmissionResultsCache'}
     })
 
-    model_manager = ag_models.Project.objects
+    model_manager = ag_models.Project.objects.select_related('course')
     permission_classes = [ag_permissions.is_admin()]
 
     def delete(self, *args, **kwargs):
@@ -307,7 +307,7 @@ class ClearResultsCacheView(AGModelAPIView):
 class DownloadTaskDetailView(AGModelDetailView):
     schema = None
 
-    model_manager = ag_models.DownloadTask.objects
+    model_manager = ag_models.DownloadTask.objects.select_related('project__course')
     permission_classes = [ag_permissions.is_admin(lambda task: task.project.course)]
 
     def get(self, *args, **kwargs):
@@ -317,7 +317,7 @@ class DownloadTaskDetailView(AGModelDetailView):
 class DownloadTaskResultView(AGModelAPIView):
     schema = None
 
-    model_manager = ag_models.DownloadTask.objects
+    model_manager = ag_models.DownloadTask.objects.select_related('project__course')
     permission_classes = [ag_permissions.is_admin(lambda task: task.project.course)]
 
     def get(self, *args, **kwargs):
@@ -1,6 +1,6 @@
 from typing import BinaryIO, Callable, Optional
 
-from django.http.response import FileResponse, JsonResponse
+from django.http.response import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from drf_composable_permissions.p import P
@@ -17,6 +17,7 @@ from autograder.core.submission_feedback import (AGTestCommandResultFeedback, AG
                                                  MutationTestSuitePreLoader,
                                                  SubmissionResultFeedback)
 from autograder.rest_api.schema import APITags, CustomViewSchema, as_content_obj, as_schema_ref
+from autograder.rest_api.size_file_response import SizeFileResponse
 from autograder.rest_api.serialize_ultimate_submission_results import \
     get_submission_data_with_results
 from autograder.rest_api.views.ag_model_views import AGModelAPIView, require_query_params
@@ -206,7 +207,7 @@ def _get_setup_output(submission_fdbk: SubmissionResultFeedback,
     stream_data = get_output_fn(suite_fdbk)
     if stream_data is None:
         return response.Response(None)
-    return FileResponse(stream_data)
+    return SizeFileResponse(stream_data)
 
 
 def _find_ag_suite_result(submission_fdbk: SubmissionResultFeedback,
@@ -324,7 +325,7 @@ def _get_cmd_result_output(submission_fdbk: SubmissionResultFeedback,
     stream_data = get_output_fn(cmd_fdbk)
     if stream_data is None:
         return response.Response(None)
-    return FileResponse(stream_data)
+    return SizeFileResponse(stream_data)
 
 
 class _DiffViewSchema(CustomViewSchema):
@@ -622,7 +623,7 @@ def _get_mutation_suite_result_output_field(
     if output_stream is None:
         return response.Response(None)
 
-    return FileResponse(output_stream)
+    return SizeFileResponse(output_stream)
 
 
 def _find_mutation_suite_result(
@@ -89,7 +89,10 @@ class _SetUpTearDownCommon:
         @override_settings(MEDIA_ROOT=os.path.join(settings.PROJECT_ROOT, 'tmp_filesystem'))
 
     NOTE: Avoid using setUpTestData until we implement some sort of filesystem
-    rollback behavior.
+    rollback behavior. Model saves create directories under MEDIA_ROOT,
+    which setUp wipes before every test. Class-level fixtures would keep
+    their database rows (thanks to Django's per-test transaction
+    rollback) but lose their directories after the first test.
     """
     def setUp(self):
         super().setUp()